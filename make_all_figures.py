@@ -0,0 +1,76 @@
+"""
+一次生成全部图表
+在同一个驱动进程中导入各绘图模块，用进程池并行生成所有图，
+避免逐个运行脚本时重复启动解释器和导入 matplotlib
+
+输出：figures/*.[png, pdf]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')  # 只输出文件，不需要交互式后端
+import matplotlib.pyplot as plt
+
+import plot_growth_respiration
+import plot_maintenance_respiration
+import plot_net_photosynthesis
+import plot_nitrogen_respiration
+import plot_rp_pg
+import plot_rubisco_rp
+import plot_temperature_respiration
+
+# 全部绘图函数，按模块分组（每个函数生成一张图的PNG和PDF）
+# 各模块的出版样式会修改全局 rcParams，同一模块的图放在同一个任务中依次生成，
+# 任务结束后恢复 rcParams，避免样式串到同一子进程中的其他模块
+PLOT_TASKS = [
+    (plot_rp_pg.make_plot,),
+    (plot_rubisco_rp.make_plot,
+     plot_rubisco_rp.make_3d_plot),
+    (plot_net_photosynthesis.make_component_plot,
+     plot_net_photosynthesis.make_stacked_plot,
+     plot_net_photosynthesis.make_sensitivity_plot),
+    (plot_maintenance_respiration.make_organ_contribution_plot,
+     plot_maintenance_respiration.make_weight_sensitivity_plot,
+     plot_maintenance_respiration.make_coefficient_comparison_plot),
+    (plot_temperature_respiration.make_temperature_response_plot,
+     plot_temperature_respiration.make_q10_sensitivity_plot,
+     plot_temperature_respiration.make_relative_change_plot),
+    (plot_nitrogen_respiration.make_nitrogen_response_plot,
+     plot_nitrogen_respiration.make_organ_comparison_plot,
+     plot_nitrogen_respiration.make_relative_change_plot),
+    (plot_growth_respiration.make_linear_response_plot,
+     plot_growth_respiration.make_coefficient_comparison_plot,
+     plot_growth_respiration.make_daily_pattern_plot,
+     plot_growth_respiration.make_composite_coefficient_plot),
+]
+
+
+def _warm_mpl():
+    """
+    子进程初始化：提前导入 matplotlib 并选择 Agg 后端（全部模块共用；PDF 由各模块保存时单独选择渲染后端）
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot  # noqa: F401
+
+
+def _run(plot_funcs):
+    """
+    在子进程中依次生成同一模块的各图，返回完成提示
+    """
+    with matplotlib.rc_context():
+        try:
+            for plot_func in plot_funcs:
+                plot_func()
+        finally:
+            # 关闭本任务中因异常未能关闭的 Figure
+            plt.close('all')
+    return f'{plot_funcs[0].__module__} 生成完成: {len(plot_funcs)} 张图'
+
+
+if __name__ == '__main__':
+    # 各图相互独立，使用多进程并行生成（pyplot 全局状态不是线程安全的）
+    with ProcessPoolExecutor(max_workers=len(PLOT_TASKS), initializer=_warm_mpl) as executor:
+        for message in executor.map(_run, PLOT_TASKS):
+            print(message)
@@ -7,16 +7,30 @@
 - r_{m,i}: 第i个器官的维持呼吸系数 (g CH₂O g⁻¹干重 d⁻¹ 或 g CH₂O g⁻¹蛋白质 d⁻¹)
 - W_i: 第i个器官的干重 (g干重 m⁻²) 或蛋白质量 (g蛋白质 m⁻²)
 
-输出：figures/maintenance_respiration_*.{png, pdf}
+输出：figures/maintenance_respiration_*.{png, pdf}（可用环境变量 PLOT_FORMATS 选择，如 PLOT_FORMATS=png）
 """
 
 from pathlib import Path
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # 只输出文件，不需要交互式后端
 import matplotlib.pyplot as plt
 
-# 设置中文字体（macOS 优先使用 PingFang SC）
-plt.rcParams['font.sans-serif'] = ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+from pub_style import PLOT_FORMATS, apply_pub_style, output_label, run_tasks, save_figure
+
+# 输出目录
+OUT_DIR = Path('figures')
+
+# 器官（叶片、茎、根、果实/籽粒）的黑白填充颜色和图案
+ORGAN_COLORS = ('0.9', '0.7', '0.5', '0.3')
+ORGAN_HATCHES = ('', '///', '\\\\\\', 'xxx')
+
+# 含花的五个器官（叶片、茎、根、果实/籽粒、花）在呼吸系数对比图中的填充颜色和图案
+FIVE_ORGAN_COLORS = ('0.9', '0.75', '0.6', '0.45', '0.3')
+FIVE_ORGAN_HATCHES = ('', '///', '\\\\\\', 'xxx', '|||')
+
+# 本模块额外的绘图参数：自动布局
+LAYOUT_RCPARAMS = {'figure.constrained_layout.use': True}
 
 
 def maintenance_respiration(organ_weights, organ_coeffs):
@@ -24,40 +38,23 @@ def maintenance_respiration(organ_weights, organ_coeffs):
     计算维持呼吸速率
     
     参数:
-        organ_weights: 各器官干重 (g m⁻²)
-        organ_coeffs: 各器官维持呼吸系数 (g CH₂O g⁻¹ d⁻¹)
+        organ_weights: 各器官干重 (g m⁻²)，array-like；二维时每行为一个时期
+        organ_coeffs: 各器官维持呼吸系数 (g CH₂O g⁻¹ d⁻¹)，array-like
     
     返回:
         Rm: 维持呼吸速率 (g CH₂O m⁻² d⁻¹)
     """
-    return np.sum(np.array(organ_weights) * np.array(organ_coeffs))
+    return np.dot(organ_weights, organ_coeffs)
 
 
-def make_organ_contribution_plot():
+def make_organ_contribution_plot(formats=PLOT_FORMATS):
     """
     绘制各器官对维持呼吸的贡献（堆积柱状图）
+    
+    formats: 输出格式（扩展名），默认由环境变量 PLOT_FORMATS 决定
     """
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
-
     # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (8, 5.5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
+    apply_pub_style(LAYOUT_RCPARAMS)
 
     # 定义器官及其参数（典型作物）
     organs = ['叶片', '茎', '根', '果实/籽粒']
@@ -74,38 +71,31 @@ def make_organ_contribution_plot():
     # 各器官维持呼吸系数 (g CH₂O g⁻¹ d⁻¹)
     coeffs = np.array([0.015, 0.010, 0.012, 0.008])
     
-    fig, ax = plt.subplots()
+    fig, ax = plt.subplots(figsize=(8, 5.5))
     
-    # 设置边框
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
-
-    # 计算各器官贡献
+    # 计算各器官贡献（各时期总量即 maintenance_respiration(weights, coeffs)）
     contributions = weights * coeffs
     
-    # 黑白填充图案和颜色
-    colors = ['0.9', '0.7', '0.5', '0.3']
-    hatches = ['', '///', '\\\\\\', 'xxx']
-    
     # x轴位置
     x = np.arange(len(growth_stages))
     width = 0.6
     
+    # 累积贡献：cum[:, i] 为前 i+1 个器官之和，最后一列即各时期总值
+    cum = np.cumsum(contributions, axis=1)
+    totals = cum[:, -1]
+    
     # 绘制堆积柱状图
-    bottom = np.zeros(len(growth_stages))
     bars = []
     for i, organ in enumerate(organs):
+        bottom = np.zeros(len(growth_stages)) if i == 0 else cum[:, i - 1]
         bar = ax.bar(x, contributions[:, i], width, bottom=bottom,
-                    label=organ, color=colors[i], edgecolor='black',
-                    linewidth=1.5, hatch=hatches[i])
+                    label=organ, color=ORGAN_COLORS[i], edgecolor='black',
+                    linewidth=1.5, hatch=ORGAN_HATCHES[i])
         bars.append(bar)
-        bottom += contributions[:, i]
     
-    # 在柱顶标注总值
-    for i, stage_total in enumerate(bottom):
-        ax.text(i, stage_total + 0.1, f'{stage_total:.1f}',
-               ha='center', va='bottom', fontsize=10, weight='bold')
+    # 在柱顶标注总值（标注在最上层柱子上）
+    ax.bar_label(bars[-1], labels=[f'{t:.1f}' for t in totals], padding=3,
+                 fontsize=10, weight='bold')
     
     # 轴标签
     ax.set_xlabel('生育期', fontsize=13, weight='bold')
@@ -129,42 +119,22 @@ def make_organ_contribution_plot():
                      edgecolor='black', linewidth=1))
     
     # 标题
-    ax.set_title('不同生育期各器官对维持呼吸的贡献', fontsize=14, pad=12, weight='bold')
-    
-    plt.tight_layout()
+    ax.set_title('不同生育期各器官对维持呼吸的贡献', fontsize=14, weight='bold')
     
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'maintenance_respiration_organs.{ext}', bbox_inches='tight')
-    
+    save_figure(fig, OUT_DIR / 'maintenance_respiration_organs', formats)
+
     plt.close(fig)
 
 
-def make_weight_sensitivity_plot():
+def make_weight_sensitivity_plot(formats=PLOT_FORMATS):
     """
     绘制维持呼吸对器官干重的响应
+    
+    formats: 输出格式（扩展名），默认由环境变量 PLOT_FORMATS 决定
     """
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
-
     # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (7.5, 5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
+    apply_pub_style(LAYOUT_RCPARAMS)
 
     # 器官名称
     organs = ['叶片', '茎', '根', '总计']
@@ -178,21 +148,15 @@ def make_weight_sensitivity_plot():
     W_stem = 100  # g m⁻²
     W_root = 100  # g m⁻²
     
-    # 叶片干重范围
-    W_leaf = np.linspace(0, 400, 300)
-    
-    # 计算各部分呼吸
-    Rm_leaf = r_leaf * W_leaf
-    Rm_stem = r_stem * W_stem * np.ones_like(W_leaf)
-    Rm_root = r_root * W_root * np.ones_like(W_leaf)
-    Rm_total = Rm_leaf + Rm_stem + Rm_root
+    # 叶片干重范围（各曲线均为直线，两个端点即可）
+    W_leaf = np.array([0.0, 400.0])
     
-    fig, ax = plt.subplots()
+    # 各部分呼吸均为叶重的线性函数 Rm = 斜率 · W_leaf + 截距：
+    # 叶片斜率为 r_leaf；茎、根呼吸与叶重无关，为常数（斜率为 0）
+    Rm_stem_val = r_stem * W_stem
+    Rm_root_val = r_root * W_root
     
-    # 设置边框
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
+    fig, ax = plt.subplots(figsize=(7.5, 5))
     
     # 黑白线型样式
     linestyles = ['-', '--', '-.', '-']
@@ -200,22 +164,22 @@ def make_weight_sensitivity_plot():
     linewidths = [2, 2, 2, 3]
     markers = ['o', 's', '^', 'D']
     
-    # 绘制各组分
-    data = [Rm_leaf, Rm_stem, Rm_root, Rm_total]
+    # 绘制各组分：(斜率, 截距)
+    data = [(r_leaf, 0.0), (0.0, Rm_stem_val), (0.0, Rm_root_val),
+            (r_leaf, Rm_stem_val + Rm_root_val)]
     
-    for i, (organ, Rm, ls, color, lw, marker) in enumerate(
+    # 标记点位置：各器官4个点，总计线6个点
+    W_marks_short = np.linspace(40, 360, 4)
+    W_marks_long = np.linspace(40, 360, 6)
+    
+    for i, (organ, (slope, intercept), ls, color, lw, marker) in enumerate(
         zip(organs, data, linestyles, colors, linewidths, markers)):
-        
-        ax.plot(W_leaf, Rm, color=color, linestyle=ls, linewidth=lw,
+        ax.plot(W_leaf, slope * W_leaf + intercept, color=color, linestyle=ls, linewidth=lw,
                label=organ, zorder=10 if organ == '总计' else 5)
         
-        # 添加标记点
-        if i < 3:  # 不在总计线上加太多点
-            sample_indices = np.linspace(30, len(W_leaf)-30, 4, dtype=int)
-        else:
-            sample_indices = np.linspace(30, len(W_leaf)-30, 6, dtype=int)
-            
-        ax.plot(W_leaf[sample_indices], Rm[sample_indices], marker=marker,
+        # 添加标记点（直线上的点直接按解析式计算）
+        W_marks = W_marks_short if i < 3 else W_marks_long
+        ax.plot(W_marks, slope * W_marks + intercept, marker=marker,
                color=color, markersize=6 if organ != '总计' else 7,
                linestyle='None', markerfacecolor='white', markeredgewidth=1.5,
                zorder=11 if organ == '总计' else 6)
@@ -239,42 +203,22 @@ def make_weight_sensitivity_plot():
                      edgecolor='black', linewidth=1))
     
     # 标题
-    ax.set_title('维持呼吸速率对叶片干重的响应', fontsize=14, pad=12, weight='bold')
-    
-    plt.tight_layout()
+    ax.set_title('维持呼吸速率对叶片干重的响应', fontsize=14, weight='bold')
     
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'maintenance_respiration_sensitivity.{ext}', bbox_inches='tight')
-    
+    save_figure(fig, OUT_DIR / 'maintenance_respiration_sensitivity', formats)
+
     plt.close(fig)
 
 
-def make_coefficient_comparison_plot():
+def make_coefficient_comparison_plot(formats=PLOT_FORMATS):
     """
     比较不同器官维持呼吸系数的差异
+    
+    formats: 输出格式（扩展名），默认由环境变量 PLOT_FORMATS 决定
     """
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
-
     # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (7.5, 5.5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
+    apply_pub_style(LAYOUT_RCPARAMS)
 
     # 器官和对应的呼吸系数（典型值和范围）
     organs = ['叶片', '茎', '根', '果实/籽粒', '花']
@@ -284,12 +228,6 @@ def make_coefficient_comparison_plot():
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(11, 5))
     
-    # 设置两个子图的边框
-    for ax in [ax1, ax2]:
-        for spine in ax.spines.values():
-            spine.set_edgecolor('black')
-            spine.set_linewidth(1.2)
-    
     # === 左图：柱状图显示系数对比 ===
     x = np.arange(len(organs))
     width = 0.6
@@ -304,9 +242,7 @@ def make_coefficient_comparison_plot():
                 capsize=5, capthick=1.5, linewidth=1.5, label='变化范围')
     
     # 在柱顶标注数值
-    for i, (mean, bar) in enumerate(zip(coeffs_mean, bars)):
-        ax1.text(i, mean + 0.0005, f'{mean:.3f}',
-                ha='center', va='bottom', fontsize=9)
+    ax1.bar_label(bars, labels=[f'{v:.3f}' for v in coeffs_mean], padding=3, fontsize=9)
     
     # 轴标签
     ax1.set_xlabel('器官', fontsize=12, weight='bold')
@@ -319,7 +255,7 @@ def make_coefficient_comparison_plot():
     ax1.legend(frameon=True, loc='upper right', edgecolor='black', fancybox=False)
     ax1.grid(True, which='major', linestyle=':', color='0.5', alpha=0.5, 
             linewidth=0.8, axis='y')
-    ax1.set_title('各器官维持呼吸系数对比', fontsize=13, pad=10, weight='bold')
+    ax1.set_title('各器官维持呼吸系数对比', fontsize=13, weight='bold')
     
     # === 右图：固定干重下的呼吸速率对比 ===
     # 假设每个器官都有100 g m⁻²的干重
@@ -328,14 +264,10 @@ def make_coefficient_comparison_plot():
     Rm_min = coeffs_min * W_fixed
     Rm_max = coeffs_max * W_fixed
     
-    # 填充图案
-    hatches = ['', '///', '\\\\\\', 'xxx', '|||']
-    colors_pattern = ['0.9', '0.75', '0.6', '0.45', '0.3']
-    
     bars2 = ax2.bar(x, Rm_values, width, edgecolor='black', linewidth=1.5)
     
     # 为每个柱子设置不同的填充
-    for bar, color, hatch in zip(bars2, colors_pattern, hatches):
+    for bar, color, hatch in zip(bars2, FIVE_ORGAN_COLORS, FIVE_ORGAN_HATCHES):
         bar.set_facecolor(color)
         bar.set_hatch(hatch)
     
@@ -345,9 +277,7 @@ def make_coefficient_comparison_plot():
                 capsize=5, capthick=1.5, linewidth=1.5)
     
     # 在柱顶标注数值
-    for i, val in enumerate(Rm_values):
-        ax2.text(i, val + 0.05, f'{val:.2f}',
-                ha='center', va='bottom', fontsize=9)
+    ax2.bar_label(bars2, labels=[f'{v:.2f}' for v in Rm_values], padding=3, fontsize=9)
     
     # 轴标签
     ax2.set_xlabel('器官', fontsize=12, weight='bold')
@@ -360,27 +290,21 @@ def make_coefficient_comparison_plot():
     ax2.grid(True, which='major', linestyle=':', color='0.5', alpha=0.5, 
             linewidth=0.8, axis='y')
     ax2.set_title(f'固定干重({W_fixed} g m$^{{-2}}$)下的呼吸速率',
-                 fontsize=13, pad=10, weight='bold')
-    
-    plt.tight_layout()
+                 fontsize=13, weight='bold')
     
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'maintenance_respiration_coefficients.{ext}', bbox_inches='tight')
-    
+    save_figure(fig, OUT_DIR / 'maintenance_respiration_coefficients', formats)
+
     plt.close(fig)
 
 
 if __name__ == '__main__':
-    # 生成器官贡献图
-    make_organ_contribution_plot()
-    print('器官贡献图生成完成: figures/maintenance_respiration_organs.[png, pdf]')
-    
-    # 生成干重敏感性分析图
-    make_weight_sensitivity_plot()
-    print('干重敏感性图生成完成: figures/maintenance_respiration_sensitivity.[png, pdf]')
-    
-    # 生成呼吸系数对比图
-    make_coefficient_comparison_plot()
-    print('呼吸系数对比图生成完成: figures/maintenance_respiration_coefficients.[png, pdf]')
-
+    tasks = [
+        (make_organ_contribution_plot,
+         '器官贡献图生成完成: ' + output_label('maintenance_respiration_organs')),
+        (make_weight_sensitivity_plot,
+         '干重敏感性图生成完成: ' + output_label('maintenance_respiration_sensitivity')),
+        (make_coefficient_comparison_plot,
+         '呼吸系数对比图生成完成: ' + output_label('maintenance_respiration_coefficients')),
+    ]
+    run_tasks(tasks)
@@ -8,18 +8,48 @@
 - V_o: Rubisco加氧速率  
 - R_d: 暗呼吸速率
 
-输出：figures/net_photosynthesis.[png, svg, pdf, eps]
+输出：figures/net_photosynthesis*.[png, pdf]（可用环境变量 PLOT_FORMATS 选择，如 PLOT_FORMATS=png）
 """
 
 from pathlib import Path
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # 只输出文件，不需要交互式后端
 import matplotlib.pyplot as plt
+from matplotlib.backends import backend_pdf  # noqa: F401  提前加载，避免首次保存PDF时再导入
+from matplotlib.patches import Polygon
 
-# 设置中文字体（macOS 优先使用 PingFang SC）
-plt.rcParams['font.sans-serif'] = ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+from pub_style import (MARK_EVERY, PLOT_FORMATS, apply_pub_style, line_with_marks, output_label,
+                       run_tasks, save_figure)
 
-def net_photosynthesis(Vc, Vo, Rd):
+try:
+    from numba import vectorize, float64
+except ImportError:  # numba 为可选依赖，未安装时使用纯 NumPy 实现
+    vectorize = None
+
+# 输出目录
+OUT_DIR = Path('figures')
+
+# 黑白线型样式：(线型, 标记, 颜色)
+BW_STYLES = (
+    ('-', 'o', 'black'),
+    ('--', 's', '0.3'),
+    ('-.', '^', '0.5'),
+    (':', 'd', '0.7'),
+)
+
+
+if vectorize is not None:
+    # 编译为 ufunc：逐元素一次完成全部运算，大数组时不产生中间临时数组
+    @vectorize([float64(float64, float64, float64)],
+               nopython=True, cache=True)
+    def _net_photosynthesis_ufunc(Vc, Vo, Rd):
+        return Vc - 0.5 * Vo - Rd
+else:
+    _net_photosynthesis_ufunc = None
+
+
+def net_photosynthesis(Vc, Vo, Rd, out=None):
     """
     计算净光合速率
     
@@ -27,17 +57,29 @@ def net_photosynthesis(Vc, Vo, Rd):
         Vc: Rubisco羧化速率 (μmol CO₂ m⁻² s⁻¹)
         Vo: Rubisco加氧速率 (μmol O₂ m⁻² s⁻¹)
         Rd: 暗呼吸速率 (μmol CO₂ m⁻² s⁻¹)
+        out: 可选的输出数组（形状为各参数广播后的形状），用于复用缓冲区
     
     返回:
         An: 净光合速率 (μmol CO₂ m⁻² s⁻¹)
     """
-    return Vc - 0.5 * Vo - Rd
+    if _net_photosynthesis_ufunc is not None:
+        return _net_photosynthesis_ufunc(Vc, Vo, Rd, out=out)
+    
+    # 原地运算：只分配一次结果数组
+    if out is None:
+        shape = np.broadcast_shapes(np.shape(Vc), np.shape(Vo), np.shape(Rd))
+        out = np.empty(shape, dtype=np.result_type(Vc, Vo, Rd, 0.5))
+    np.multiply(Vo, -0.5, out=out)
+    out += Vc
+    out -= Rd
+    return out if out.ndim else out[()]  # 标量输入时返回标量
 
 
 def make_component_plot(
     Vc_max: float = 100.0,
     Vo_levels: list = None,
     Rd: float = 2.0,
+    formats: tuple = PLOT_FORMATS,  # 输出格式（扩展名）
 ):
     """
     绘制An的组分分析图，展示各部分对净光合的贡献
@@ -45,62 +87,29 @@ def make_component_plot(
     if Vo_levels is None:
         Vo_levels = [0, 20, 40, 60]  # 不同的加氧速率水平
     
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
-
     # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (7.5, 5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
-
-    # Vc范围
-    Vc = np.linspace(0, Vc_max, 300)
+    apply_pub_style()
+
+    # Vc范围：An 对 Vc 为线性，两个端点之间只插入 5 个标记点位置
+    Vc = line_with_marks(0.0, Vc_max)
     
-    fig, ax = plt.subplots()
+    fig, ax = plt.subplots(figsize=(7.5, 5))
     
-    # 设置边框颜色为黑色
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
-
-    # 黑白线型样式
-    linestyles = ['-', '--', '-.', ':']
-    markers = ['o', 's', '^', 'd']
-    colors = ['black', '0.3', '0.5', '0.7']
+    # 一次广播计算全部Vo水平：形状 (n_levels, n_points)
+    Vo_arr = np.asarray(Vo_levels, dtype=np.float64)[:, None]
+    An_all = net_photosynthesis(Vc, Vo_arr, Rd)
     
-    # 绘制不同Vo水平下的An曲线
+    # 绘制不同Vo水平下的An曲线（线与标记点为同一个 Line2D）
     for i, Vo in enumerate(Vo_levels):
-        An = net_photosynthesis(Vc, Vo, Rd)
-        
-        ls = linestyles[i % len(linestyles)]
-        color = colors[i % len(colors)]
-        marker = markers[i % len(markers)]
+        ls, marker, color = BW_STYLES[i % len(BW_STYLES)]
         
         label = f'$V_o$ = {Vo:.0f}' if Vo > 0 else '$V_o$ = 0 (无光呼吸)'
-        ax.plot(Vc, An, color=color, linestyle=ls, linewidth=2.5, label=label)
-        
-        # 添加标记点
-        sample_indices = np.linspace(30, len(Vc)-30, 5, dtype=int)
-        ax.plot(Vc[sample_indices], An[sample_indices], marker=marker,
-                color=color, markersize=6, linestyle='None',
+        ax.plot(Vc, An_all[i], color=color, linestyle=ls, linewidth=2.5, label=label,
+                marker=marker, markevery=MARK_EVERY, markersize=6,
                 markerfacecolor='white', markeredgewidth=1.5)
 
     # 添加参考线：Vc线（无呼吸损失时的理论最大值）
-    ax.plot(Vc, Vc, color='0.8', linestyle=':', linewidth=2, 
+    ax.plot([0, Vc_max], [0, Vc_max], color='0.8', linestyle=':', linewidth=2, 
             label='理论最大值 ($V_c$)', zorder=0)
 
     # 轴标签
@@ -131,8 +140,7 @@ def make_component_plot(
     ax.set_title('净光合速率的组分分析', fontsize=14, pad=12, weight='bold')
 
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'net_photosynthesis.{ext}', bbox_inches='tight')
+    save_figure(fig, OUT_DIR / 'net_photosynthesis', formats)
 
     plt.close(fig)
 
@@ -141,71 +149,51 @@ def make_stacked_plot(
     Vc_max: float = 100.0,
     Vo: float = 40.0,
     Rd: float = 2.0,
+    formats: tuple = PLOT_FORMATS,  # 输出格式（扩展名）
 ):
     """
     绘制堆积图，展示光合速率的各个组分
     """
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
-
     # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (7.5, 5.5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
-
-    # Vc范围
-    Vc = np.linspace(0, Vc_max, 300)
+    apply_pub_style()
+
+    # Vc范围：各组分边界均为Vc的线性函数，两个端点即可确定（中间为标记点位置）
+    Vc = line_with_marks(0.0, Vc_max)
     
     # 计算各组分
     photorespiration = -0.5 * Vo  # 光呼吸损失（负值）
     dark_respiration = -Rd         # 暗呼吸损失（负值）
     An = net_photosynthesis(Vc, Vo, Rd)
     
-    fig, ax = plt.subplots()
+    fig, ax = plt.subplots(figsize=(7.5, 5.5))
+    
+    # 绘制各组分（仅用灰度区分，不使用填充图案，PDF 输出更轻）
+    # 注意：若需恢复图案，请使用 hatch 而不是 imshow 平铺贴图——贴图会在 PDF 中嵌入位图，失去矢量清晰度
+    # 各组分区域均为直线围成的三角形/梯形，直接给出角点
+    pr, dr = photorespiration, dark_respiration
     
-    # 设置边框
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
-
-    # 绘制各组分（使用不同的灰度和图案）
     # 羧化速率（总光合）
-    ax.fill_between(Vc, 0, Vc, color='0.85', alpha=0.8, 
-                    label=r'$V_c$ (羧化速率)', edgecolor='black', linewidth=0.5)
+    ax.add_patch(Polygon([(0, 0), (Vc_max, 0), (Vc_max, Vc_max)],
+                         facecolor='0.85', alpha=0.8, label=r'$V_c$ (羧化速率)',
+                         edgecolor='black', linewidth=0.5))
     
     # 光呼吸损失（从Vc往下）
-    ax.fill_between(Vc, Vc, Vc + photorespiration, color='0.6', alpha=0.7,
-                    hatch='///', label=r'$-0.5 \cdot V_o$ (光呼吸损失)',
-                    edgecolor='black', linewidth=0.5)
+    ax.add_patch(Polygon([(0, 0), (Vc_max, Vc_max), (Vc_max, Vc_max + pr), (0, pr)],
+                         facecolor='0.55', alpha=0.7,
+                         label=r'$-0.5 \cdot V_o$ (光呼吸损失)',
+                         edgecolor='black', linewidth=0.5))
     
     # 暗呼吸损失
-    ax.fill_between(Vc, Vc + photorespiration, Vc + photorespiration + dark_respiration,
-                    color='0.4', alpha=0.7, hatch='\\\\\\',
-                    label=r'$-R_d$ (暗呼吸损失)', edgecolor='black', linewidth=0.5)
+    ax.add_patch(Polygon([(0, pr), (Vc_max, Vc_max + pr),
+                          (Vc_max, Vc_max + pr + dr), (0, pr + dr)],
+                         facecolor='0.35', alpha=0.7,
+                         label=r'$-R_d$ (暗呼吸损失)', edgecolor='black', linewidth=0.5))
     
-    # 净光合速率线
+    # 净光合速率线（含标记点）
     ax.plot(Vc, An, color='black', linestyle='-', linewidth=3,
-            label=r'$A_n$ (净光合速率)', zorder=10)
-    
-    # 添加标记点
-    sample_indices = np.linspace(30, len(Vc)-30, 5, dtype=int)
-    ax.plot(Vc[sample_indices], An[sample_indices], marker='o',
-            color='black', markersize=7, linestyle='None',
-            markerfacecolor='white', markeredgewidth=2, zorder=11)
+            label=r'$A_n$ (净光合速率)', zorder=10,
+            marker='o', markevery=MARK_EVERY, markersize=7,
+            markerfacecolor='white', markeredgewidth=2)
 
     # 轴标签
     ax.set_xlabel(r'$V_c$ - Rubisco羧化速率 (μmol CO$_2$ m$^{-2}$ s$^{-1}$)', fontsize=12)
@@ -234,8 +222,7 @@ def make_stacked_plot(
     ax.set_title('净光合速率的组分堆积分析', fontsize=14, pad=12, weight='bold')
 
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'net_photosynthesis_stacked.{ext}', bbox_inches='tight')
+    save_figure(fig, OUT_DIR / 'net_photosynthesis_stacked', formats)
 
     plt.close(fig)
 
@@ -244,6 +231,7 @@ def make_sensitivity_plot(
     Vc: float = 80.0,
     Vo_max: float = 80.0,
     Rd_levels: list = None,
+    formats: tuple = PLOT_FORMATS,  # 输出格式（扩展名）
 ):
     """
     绘制An对Vo的敏感性分析（不同Rd水平）
@@ -251,58 +239,25 @@ def make_sensitivity_plot(
     if Rd_levels is None:
         Rd_levels = [0, 1, 2, 4]
     
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
-
     # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (7.5, 5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
-
-    # Vo范围
-    Vo = np.linspace(0, Vo_max, 300)
+    apply_pub_style()
+
+    # Vo范围：An 对 Vo 为线性，两个端点之间只插入 5 个标记点位置
+    Vo = line_with_marks(0.0, Vo_max)
     
-    fig, ax = plt.subplots()
+    fig, ax = plt.subplots(figsize=(7.5, 5))
     
-    # 设置边框
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
-
-    # 黑白线型样式
-    linestyles = ['-', '--', '-.', ':']
-    markers = ['o', 's', '^', 'd']
-    colors = ['black', '0.3', '0.5', '0.7']
+    # 一次广播计算全部Rd水平：形状 (n_levels, n_points)
+    Rd_arr = np.asarray(Rd_levels, dtype=np.float64)[:, None]
+    An_all = net_photosynthesis(Vc, Vo, Rd_arr)
     
-    # 绘制不同Rd水平下的An曲线
+    # 绘制不同Rd水平下的An曲线（线与标记点为同一个 Line2D）
     for i, Rd in enumerate(Rd_levels):
-        An = net_photosynthesis(Vc, Vo, Rd)
-        
-        ls = linestyles[i % len(linestyles)]
-        color = colors[i % len(colors)]
-        marker = markers[i % len(markers)]
+        ls, marker, color = BW_STYLES[i % len(BW_STYLES)]
         
         label = f'$R_d$ = {Rd:.1f}' if Rd > 0 else '$R_d$ = 0'
-        ax.plot(Vo, An, color=color, linestyle=ls, linewidth=2.5, label=label)
-        
-        # 添加标记点
-        sample_indices = np.linspace(30, len(Vo)-30, 5, dtype=int)
-        ax.plot(Vo[sample_indices], An[sample_indices], marker=marker,
-                color=color, markersize=6, linestyle='None',
+        ax.plot(Vo, An_all[i], color=color, linestyle=ls, linewidth=2.5, label=label,
+                marker=marker, markevery=MARK_EVERY, markersize=6,
                 markerfacecolor='white', markeredgewidth=1.5)
 
     # 轴标签
@@ -332,22 +287,18 @@ def make_sensitivity_plot(
     ax.set_title('净光合速率对加氧速率的响应', fontsize=14, pad=12, weight='bold')
 
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'net_photosynthesis_vo_response.{ext}', bbox_inches='tight')
+    save_figure(fig, OUT_DIR / 'net_photosynthesis_vo_response', formats)
 
     plt.close(fig)
 
 
 if __name__ == '__main__':
-    # 生成组分分析图
-    make_component_plot()
-    print('组分分析图生成完成: figures/net_photosynthesis.[png, pdf]')
-    
-    # 生成堆积图
-    make_stacked_plot()
-    print('堆积分析图生成完成: figures/net_photosynthesis_stacked.[png, pdf]')
-    
-    # 生成敏感性分析图
-    make_sensitivity_plot()
-    print('敏感性分析图生成完成: figures/net_photosynthesis_vo_response.[png, pdf]')
-
+    tasks = [
+        (make_component_plot,
+         '组分分析图生成完成: ' + output_label('net_photosynthesis')),
+        (make_stacked_plot,
+         '堆积分析图生成完成: ' + output_label('net_photosynthesis_stacked')),
+        (make_sensitivity_plot,
+         '敏感性分析图生成完成: ' + output_label('net_photosynthesis_vo_response')),
+    ]
+    run_tasks(tasks)
@@ -8,19 +8,55 @@
 - N_i: 当前氮含量
 - N_{ref}: 参考氮含量
 
-输出：figures/nitrogen_respiration_*.{png, pdf}
+输出：figures/nitrogen_respiration_*.{png, pdf}（可用环境变量 PLOT_FORMATS 选择，如 PLOT_FORMATS=png）
 """
 
 from pathlib import Path
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # 只输出文件，不需要交互式后端
 import matplotlib.pyplot as plt
+from matplotlib.backends import backend_pdf  # noqa: F401  提前加载，避免首次保存PDF时再导入
 
-# 设置中文字体（macOS 优先使用 PingFang SC）
-plt.rcParams['font.sans-serif'] = ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+from pub_style import (MARK_EVERY, PLOT_FORMATS, apply_pub_style, line_with_marks, output_label,
+                       run_tasks, save_figure)
 
+try:
+    from numba import vectorize, float64
+except ImportError:  # numba 为可选依赖，未安装时使用纯 NumPy 实现
+    vectorize = None
 
-def nitrogen_respiration_coefficient(Ni, r_ref, N_ref):
+# 输出目录
+OUT_DIR = Path('figures')
+
+# 300 点采样曲线上 5 个标记点的下标（只读）
+SAMPLE_IDX_300 = np.linspace(30, 270, 5, dtype=np.intp)
+SAMPLE_IDX_300.flags.writeable = False
+
+# 黑白线型样式：(线型, 颜色, 标记, 线宽)，中间一条为典型值
+REF_STYLES = (
+    ('--', '0.5', 's', 2),
+    ('-', 'black', 'o', 3),
+    ('-.', '0.3', '^', 2),
+)
+ORGAN_STYLES = (
+    ('-', 'black', 'o', 2.5),
+    ('--', '0.4', 's', 2.5),
+    ('-.', '0.6', '^', 2.5),
+)
+
+
+if vectorize is not None:
+    # 编译为 ufunc：逐元素一次完成全部运算，大数组时不产生中间临时数组
+    @vectorize([float64(float64, float64, float64)],
+               nopython=True, cache=True)
+    def _nitrogen_coefficient_ufunc(Ni, r_ref, N_ref):
+        return r_ref * (Ni / N_ref)
+else:
+    _nitrogen_coefficient_ufunc = None
+
+
+def nitrogen_respiration_coefficient(Ni, r_ref, N_ref, out=None):
     """
     计算当前氮含量下的维持呼吸系数
     
@@ -28,38 +64,43 @@ def nitrogen_respiration_coefficient(Ni, r_ref, N_ref):
         Ni: 当前氮含量 (g N g⁻¹干重 或 %)
         r_ref: 参考呼吸系数 (g CH₂O g⁻¹ d⁻¹)
         N_ref: 参考氮含量 (g N g⁻¹干重 或 %)
+        out: 可选的输出数组（形状为各参数广播后的形状），用于复用缓冲区
     
     返回:
         r_mi: 当前氮含量下的呼吸系数 (g CH₂O g⁻¹ d⁻¹)
     """
-    return r_ref * (Ni / N_ref)
+    if _nitrogen_coefficient_ufunc is not None:
+        return _nitrogen_coefficient_ufunc(Ni, r_ref, N_ref, out=out)
+    
+    # 原地运算：只分配一次结果数组
+    if out is None:
+        shape = np.broadcast_shapes(np.shape(Ni), np.shape(r_ref), np.shape(N_ref))
+        out = np.empty(shape, dtype=np.result_type(Ni, r_ref, N_ref, 1.0))
+    np.true_divide(Ni, N_ref, out=out)
+    out *= r_ref
+    return out if out.ndim else out[()]  # 标量输入时返回标量
 
 
-def make_nitrogen_response_plot():
+def _make_styled_fig(figsize, grid_alpha=0.7):
     """
-    绘制维持呼吸系数对氮含量的响应曲线
+    创建统一样式的画布：点线网格（黑色边框由 pub_style 的出版级参数设定）
     """
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
+    fig, ax = plt.subplots(figsize=figsize)
+    
+    # 网格
+    ax.grid(True, which='major', linestyle=':', color='0.5', alpha=grid_alpha, linewidth=0.8)
+    
+    return fig, ax
 
+
+def make_nitrogen_response_plot(formats=PLOT_FORMATS):
+    """
+    绘制维持呼吸系数对氮含量的响应曲线
+    
+    formats: 输出格式（扩展名），默认由环境变量 PLOT_FORMATS 决定
+    """
     # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (7.5, 5.5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
+    apply_pub_style()
 
     # 参考值（典型叶片）
     N_ref = 3.0  # 参考氮含量 (%)
@@ -68,39 +109,22 @@ def make_nitrogen_response_plot():
     # 氮含量范围 (%)
     Ni = np.linspace(0.5, 6.0, 300)
     
-    fig, ax = plt.subplots()
-    
-    # 设置边框
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
-    
-    # 黑白线型样式
-    linestyles = ['--', '-', '-.']
-    colors = ['0.5', 'black', '0.3']
-    markers = ['s', 'o', '^']
-    linewidths = [2, 3, 2]
+    fig, ax = _make_styled_fig(figsize=(7.5, 5.5))
     
     # 绘制不同参考呼吸系数的曲线
     for i, r_ref in enumerate(r_ref_values):
         r_mi = nitrogen_respiration_coefficient(Ni, r_ref, N_ref)
         
-        ls = linestyles[i]
-        color = colors[i]
-        marker = markers[i]
-        lw = linewidths[i]
+        ls, color, marker, lw = REF_STYLES[i]
         
         label = f'$r_{{ref}}$ = {r_ref:.3f}' + (' (典型值)' if r_ref == 0.015 else '')
         
+        # 线与标记点为同一个 Line2D
         ax.plot(Ni, r_mi, color=color, linestyle=ls, linewidth=lw, label=label,
+               marker=marker, markevery=SAMPLE_IDX_300,
+               markersize=6 if r_ref != 0.015 else 7,
+               markerfacecolor='white', markeredgewidth=1.5,
                zorder=10 if r_ref == 0.015 else 5)
-        
-        # 添加标记点
-        sample_indices = np.linspace(30, len(Ni)-30, 5, dtype=int)
-        ax.plot(Ni[sample_indices], r_mi[sample_indices], marker=marker,
-               color=color, markersize=6 if r_ref != 0.015 else 7,
-               linestyle='None', markerfacecolor='white', markeredgewidth=1.5,
-               zorder=11 if r_ref == 0.015 else 6)
     
     # 标注参考点
     r_ref_typical = 0.015
@@ -126,9 +150,6 @@ def make_nitrogen_response_plot():
     ax.legend(frameon=True, loc='upper left', edgecolor='black', 
               fancybox=False, fontsize=10)
     
-    # 网格
-    ax.grid(True, which='major', linestyle=':', color='0.5', alpha=0.7, linewidth=0.8)
-    
     # 公式标注
     formula = r"$r'_{m,i} = r_{ref} \times \frac{N_i}{N_{ref}}$"
     param_text = f'$N_{{ref}}$ = {N_ref:.1f}%'
@@ -143,37 +164,19 @@ def make_nitrogen_response_plot():
     plt.tight_layout()
     
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'nitrogen_respiration.{ext}', bbox_inches='tight')
+    save_figure(fig, OUT_DIR / 'nitrogen_respiration', formats)
     
     plt.close(fig)
 
 
-def make_organ_comparison_plot():
+def make_organ_comparison_plot(formats=PLOT_FORMATS):
     """
     绘制不同器官在不同氮含量下的呼吸系数对比
+    
+    formats: 输出格式（扩展名），默认由环境变量 PLOT_FORMATS 决定
     """
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
-
     # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (8, 5.5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
+    apply_pub_style()
 
     # 不同器官的参考值
     organs = ['叶片', '茎', '根']
@@ -183,34 +186,17 @@ def make_organ_comparison_plot():
     # 氮含量范围
     Ni = np.linspace(0.5, 5.0, 300)
     
-    fig, ax = plt.subplots()
-    
-    # 设置边框
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
-    
-    # 黑白线型样式
-    linestyles = ['-', '--', '-.']
-    colors = ['black', '0.4', '0.6']
-    markers = ['o', 's', '^']
-    linewidths = [2.5, 2.5, 2.5]
+    fig, ax = _make_styled_fig(figsize=(8, 5.5))
     
     # 绘制各器官曲线
     for i, (organ, r_ref, N_ref) in enumerate(zip(organs, r_ref_organs, N_ref_organs)):
         r_mi = nitrogen_respiration_coefficient(Ni, r_ref, N_ref)
         
-        ls = linestyles[i]
-        color = colors[i]
-        marker = markers[i]
-        lw = linewidths[i]
-        
-        ax.plot(Ni, r_mi, color=color, linestyle=ls, linewidth=lw, label=organ)
+        ls, color, marker, lw = ORGAN_STYLES[i]
         
-        # 添加标记点
-        sample_indices = np.linspace(30, len(Ni)-30, 5, dtype=int)
-        ax.plot(Ni[sample_indices], r_mi[sample_indices], marker=marker,
-               color=color, markersize=6, linestyle='None',
+        # 线与标记点为同一个 Line2D
+        ax.plot(Ni, r_mi, color=color, linestyle=ls, linewidth=lw, label=organ,
+               marker=marker, markevery=SAMPLE_IDX_300, markersize=6,
                markerfacecolor='white', markeredgewidth=1.5)
         
         # 标注各器官的参考点
@@ -229,9 +215,6 @@ def make_organ_comparison_plot():
     ax.legend(frameon=True, loc='upper left', edgecolor='black', 
               fancybox=False, fontsize=11)
     
-    # 网格
-    ax.grid(True, which='major', linestyle=':', color='0.5', alpha=0.7, linewidth=0.8)
-    
     # 公式标注
     formula = r"$r'_{m,i} = r_{ref} \times \frac{N_i}{N_{ref}}$"
     ax.text(0.98, 0.95, formula, transform=ax.transAxes,
@@ -245,78 +228,44 @@ def make_organ_comparison_plot():
     plt.tight_layout()
     
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'nitrogen_respiration_organs.{ext}', bbox_inches='tight')
+    save_figure(fig, OUT_DIR / 'nitrogen_respiration_organs', formats)
     
     plt.close(fig)
 
 
-def make_relative_change_plot():
+def make_relative_change_plot(formats=PLOT_FORMATS):
     """
     绘制相对于参考氮含量的呼吸系数变化倍数
+    
+    formats: 输出格式（扩展名），默认由环境变量 PLOT_FORMATS 决定
     """
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
-
     # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (7.5, 5.5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
+    apply_pub_style()
 
     # 不同参考氮含量
     N_ref_values = [2.0, 3.0, 4.0]
     
-    # 氮含量范围 (%)
-    Ni = np.linspace(0.5, 6.0, 300)
-    
-    fig, ax = plt.subplots()
+    # 氮含量范围 (%)：相对变化对Ni线性，两个端点之间只插入 5 个标记点位置
+    Ni = line_with_marks(0.5, 6.0)
     
-    # 设置边框
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
+    # 相对变化 = r'_mi / r_ref = Ni / N_ref，一次广播计算全部N_ref
+    N_ref_arr = np.asarray(N_ref_values, dtype=np.float64)[:, None]
+    rel = Ni / N_ref_arr
     
-    # 黑白线型样式
-    linestyles = ['--', '-', '-.']
-    colors = ['0.5', 'black', '0.3']
-    markers = ['s', 'o', '^']
-    linewidths = [2, 3, 2]
+    fig, ax = _make_styled_fig(figsize=(7.5, 5.5), grid_alpha=0.5)
     
     # 绘制相对变化曲线
     for i, N_ref in enumerate(N_ref_values):
-        # 相对变化 = r'_mi / r_ref = Ni / N_ref
-        relative_change = Ni / N_ref
-        
-        ls = linestyles[i]
-        color = colors[i]
-        marker = markers[i]
-        lw = linewidths[i]
+        ls, color, marker, lw = REF_STYLES[i]
         
         label = f'$N_{{ref}}$ = {N_ref:.1f}%' + (' (典型值)' if N_ref == 3.0 else '')
         
-        ax.plot(Ni, relative_change, color=color, linestyle=ls, linewidth=lw, 
-               label=label, zorder=10 if N_ref == 3.0 else 5)
-        
-        # 添加标记点
-        sample_indices = np.linspace(30, len(Ni)-30, 5, dtype=int)
-        ax.plot(Ni[sample_indices], relative_change[sample_indices], marker=marker,
-               color=color, markersize=6 if N_ref != 3.0 else 7,
-               linestyle='None', markerfacecolor='white', markeredgewidth=1.5,
-               zorder=11 if N_ref == 3.0 else 6)
+        # 线与标记点为同一个 Line2D，首尾端点不画标记
+        ax.plot(Ni, rel[i], color=color, linestyle=ls, linewidth=lw, label=label,
+               marker=marker, markevery=MARK_EVERY,
+               markersize=6 if N_ref != 3.0 else 7,
+               markerfacecolor='white', markeredgewidth=1.5,
+               zorder=10 if N_ref == 3.0 else 5)
     
     # 添加基准线 (倍数=1)
     ax.axhline(y=1, color='0.5', linestyle='-', linewidth=1.5, zorder=0,
@@ -339,9 +288,6 @@ def make_relative_change_plot():
     ax.legend(frameon=True, loc='upper left', edgecolor='black', 
               fancybox=False, fontsize=10)
     
-    # 网格
-    ax.grid(True, which='major', linestyle=':', color='0.5', alpha=0.5, linewidth=0.8)
-    
     # 公式标注
     formula = r"$\frac{r'_{m,i}}{r_{ref}} = \frac{N_i}{N_{ref}}$"
     ax.text(0.98, 0.95, formula, transform=ax.transAxes,
@@ -355,22 +301,18 @@ def make_relative_change_plot():
     plt.tight_layout()
     
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'nitrogen_respiration_relative.{ext}', bbox_inches='tight')
+    save_figure(fig, OUT_DIR / 'nitrogen_respiration_relative', formats)
     
     plt.close(fig)
 
 
 if __name__ == '__main__':
-    # 生成氮含量响应曲线
-    make_nitrogen_response_plot()
-    print('氮含量响应图生成完成: figures/nitrogen_respiration.[png, pdf]')
-    
-    # 生成器官对比图
-    make_organ_comparison_plot()
-    print('器官对比图生成完成: figures/nitrogen_respiration_organs.[png, pdf]')
-    
-    # 生成相对变化图
-    make_relative_change_plot()
-    print('相对变化图生成完成: figures/nitrogen_respiration_relative.[png, pdf]')
-
+    tasks = [
+        (make_nitrogen_response_plot,
+         '氮含量响应图生成完成: ' + output_label('nitrogen_respiration')),
+        (make_organ_comparison_plot,
+         '器官对比图生成完成: ' + output_label('nitrogen_respiration_organs')),
+        (make_relative_change_plot,
+         '相对变化图生成完成: ' + output_label('nitrogen_respiration_relative')),
+    ]
+    run_tasks(tasks)
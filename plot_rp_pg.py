@@ -2,20 +2,40 @@
 作物呼吸速率与总光合速率的线性关系可视化
 公式：R_p = α · P_g
 
-输出：figures/rp_vs_pg.[png, svg, pdf, eps]
+输出：figures/rp_vs_pg.[png, pdf]
 - PNG：300 dpi，适用于书籍排版
-- SVG/PDF/EPS：矢量格式，适合印刷与放大
+- PDF：矢量格式，适合印刷与放大
+- 可用环境变量 PLOT_FORMATS 选择输出格式（如 PLOT_FORMATS=png）
 
 可编辑参数：alpha, alpha_min, alpha_max, unit, pg_max
 """
 
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # 只输出文件，不需要交互式后端
 import matplotlib.pyplot as plt
+from matplotlib.backends import backend_pdf  # noqa: F401  提前加载，避免首次保存PDF时再导入
+
+from pub_style import PLOT_FORMATS, apply_pub_style, output_label, save_figure
+
+# 输出目录
+OUT_DIR = Path('figures')
+
+
+@lru_cache(maxsize=8)
+def _sample_points(alpha, pg_max, n=12, seed=42):
+    """
+    生成沿典型线分布的示例数据点（固定种子，结果按参数缓存，数组只读）
+    """
+    rng = np.random.default_rng(seed)
+    pg_points = rng.uniform(0.1 * pg_max, 0.95 * pg_max, n)
+    rp_points = alpha * pg_points + rng.normal(0, 0.03 * alpha * pg_max, n)
+    pg_points.flags.writeable = False
+    rp_points.flags.writeable = False
+    return pg_points, rp_points
 
-# 设置中文字体（macOS 优先使用 PingFang SC）
-plt.rcParams['font.sans-serif'] = ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
 
 def make_plot(
     alpha: float = 0.45,
@@ -23,43 +43,19 @@ def make_plot(
     alpha_max: float = 0.60,
     unit: str = r'μmol CO$_2$ m$^{-2}$ s$^{-1}$',
     pg_max: float = 40.0,
+    formats: tuple = PLOT_FORMATS,  # 输出格式（扩展名）
 ):
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
-
     # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (6.5, 4.5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        # 使用 TrueType 字体以获得更清晰的矢量文本
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
-
-    # 数据
-    x = np.linspace(0, pg_max, 200)
+    apply_pub_style()
+
+    # 数据（各线均过原点的直线，两个端点即可）
+    x = np.array([0.0, pg_max])
     y_typ = alpha * x
     y_min = alpha_min * x
     y_max = alpha_max * x
 
-    fig, ax = plt.subplots()
+    fig, ax = plt.subplots(figsize=(6.5, 4.5))
     
-    # 设置边框颜色为黑色
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
-
     # α 范围阴影带（黑白风格）
     ax.fill_between(x, y_min, y_max, color='0.75', alpha=0.5,
                     label=f'α范围 {alpha_min:.2f}–{alpha_max:.2f}')
@@ -69,10 +65,7 @@ def make_plot(
             label=f'典型α = {alpha:.2f}')
 
     # 示例数据点（沿典型线加小噪声）
-    rng = np.random.default_rng(42)
-    n = 12
-    pg_points = rng.uniform(0.1 * pg_max, 0.95 * pg_max, n)
-    rp_points = alpha * pg_points + rng.normal(0, 0.03 * alpha * pg_max, n)
+    pg_points, rp_points = _sample_points(alpha, pg_max)
     ax.scatter(pg_points, rp_points, s=50, color='white',
                edgecolor='black', linewidth=1.5, label='示例数据点')
 
@@ -96,12 +89,11 @@ def make_plot(
     ax.set_title('作物呼吸速率与总光合速率的线性关系', fontsize=14, pad=12)
 
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'rp_vs_pg.{ext}', bbox_inches='tight')
+    save_figure(fig, OUT_DIR / 'rp_vs_pg', formats)
 
     plt.close(fig)
 
 
 if __name__ == '__main__':
     make_plot()
-    print('生成完成: figures/rp_vs_pg.[png, pdf]')
\ No newline at end of file
+    print('生成完成: ' + output_label('rp_vs_pg'))
\ No newline at end of file
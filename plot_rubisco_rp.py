@@ -2,22 +2,46 @@
 Rubisco呼吸速率与CO₂和O₂浓度的关系可视化
 公式：R_p = R_{pmax} * [O₂/Ks] / [(CO₂/Kc) + (1 + O₂/Ko)]
 
-输出：figures/rubisco_rp.[png, svg, pdf, eps]
+输出：figures/rubisco_rp.[png, pdf], figures/rubisco_rp_3d.[png, pdf]
 - PNG：300 dpi，适用于书籍排版
-- SVG/PDF/EPS：矢量格式，适合印刷与放大
+- PDF：矢量格式，适合印刷与放大
+- 可用环境变量 PLOT_FORMATS 选择输出格式（如 PLOT_FORMATS=png）
 
 可编辑参数：Rpmax, Ks, Kc, Ko, CO2范围, O2浓度
 """
 
 from pathlib import Path
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # 只输出文件，不需要交互式后端
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
-# 设置中文字体（macOS 优先使用 PingFang SC）
-plt.rcParams['font.sans-serif'] = ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+from pub_style import (CAIRO_PDF_BACKEND, PLOT_FORMATS, apply_pub_style, output_label, run_tasks,
+                       save_figure)
 
-def rubisco_rp(CO2, O2, Rpmax, Ks, Kc, Ko):
+try:
+    from numba import njit, prange, vectorize, float64
+except ImportError:  # numba 为可选依赖，未安装时使用纯 NumPy 实现
+    vectorize = njit = None
+
+# 输出目录
+OUT_DIR = Path('figures')
+
+
+if vectorize is not None:
+    # 编译为 ufunc：逐元素一次完成全部运算，大数组时不产生中间临时数组
+    # （传入的是 Rpmax/Ks 与 1/Kc、1/Ko，逐元素只剩一次除法）
+    @vectorize([float64(float64, float64, float64, float64, float64)],
+               nopython=True, cache=True)
+    def _rubisco_rp_ufunc(CO2, O2, Rpmax_Ks, inv_Kc, inv_Ko):
+        return O2 * Rpmax_Ks / (CO2 * inv_Kc + 1.0 + O2 * inv_Ko)
+else:
+    _rubisco_rp_ufunc = None
+
+
+def rubisco_rp(CO2, O2, Rpmax, Ks, Kc, Ko, out=None):
     """
     计算Rubisco呼吸速率
     
@@ -28,10 +52,51 @@ def rubisco_rp(CO2, O2, Rpmax, Ks, Kc, Ko):
         Ks: O₂的Michaelis常数
         Kc: CO₂的Michaelis常数
         Ko: O₂的抑制常数
+        out: 可选的输出数组（形状为各参数广播后的形状），用于复用缓冲区
+    """
+    # 常数的倒数只计算一次，逐元素的除法改为乘法
+    Rpmax_Ks = np.divide(Rpmax, Ks)
+    inv_Kc = np.divide(1.0, Kc)
+    inv_Ko = np.divide(1.0, Ko)
+    if _rubisco_rp_ufunc is not None:
+        return _rubisco_rp_ufunc(CO2, O2, Rpmax_Ks, inv_Kc, inv_Ko, out=out)
+    
+    # 原地运算：只分配一次结果数组，先在其中累加分母，再用分子除以它；
+    # O2 相关的中间量只有 O2 自身的大小（稀疏网格时为一列）
+    if out is None:
+        shape = np.broadcast_shapes(*(np.shape(v) for v in (CO2, O2, Rpmax, Ks, Kc, Ko)))
+        out = np.empty(shape, dtype=np.result_type(CO2, O2, Rpmax, Ks, Kc, Ko, 1.0))
+    np.multiply(CO2, inv_Kc, out=out)
+    out += 1
+    out += O2 * inv_Ko
+    np.divide(O2 * Rpmax_Ks, out, out=out)
+    return out if out.ndim else out[()]  # 标量输入时返回标量
+
+
+if njit is not None:
+    # 网格计算核：按行并行，O₂ 相关的分子与分母常数项每行只算一次，直接写入结果数组
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rubisco_rp_grid_kernel(co2, o2, Rpmax_Ks, inv_Kc, inv_Ko, out):
+        for i in prange(o2.shape[0]):
+            num = o2[i] * Rpmax_Ks
+            base = 1.0 + o2[i] * inv_Ko
+            for j in range(co2.shape[0]):
+                out[i, j] = num / (co2[j] * inv_Kc + base)
+else:
+    _rubisco_rp_grid_kernel = None
+
+
+def _rubisco_rp_grid(co2, o2, Rpmax, Ks, Kc, Ko):
     """
-    numerator = (O2 / Ks)
-    denominator = (CO2 / Kc) + (1 + O2 / Ko)
-    return Rpmax * numerator / denominator
+    在 O₂（行）× CO₂（列）网格上计算Rp，co2 与 o2 为一维坐标轴
+    """
+    if _rubisco_rp_grid_kernel is None:
+        return rubisco_rp(co2[None, :], o2[:, None], Rpmax, Ks, Kc, Ko)
+    out = np.empty((o2.shape[0], co2.shape[0]))
+    _rubisco_rp_grid_kernel(np.asarray(co2, dtype=np.float64), np.asarray(o2, dtype=np.float64),
+                            Rpmax / Ks, 1.0 / Kc, 1.0 / Ko, out)
+    return out
+
 
 def make_plot(
     Rpmax: float = 20.0,        # 最大呼吸速率
@@ -40,63 +105,54 @@ def make_plot(
     Ko: float = 25.0,           # O₂的抑制常数 (mmol mol⁻¹)
     co2_range: tuple = (0, 1000),  # CO₂浓度范围 (μmol mol⁻¹)
     o2_levels: list = None,     # 不同的O₂浓度水平 (mmol mol⁻¹)
+    n_points: int = 150,        # 每条曲线的采样点数（少于约 150 点时 PDF 路径简化失效，文件反而变大）
+    formats: tuple = PLOT_FORMATS,  # 输出格式（扩展名）
 ):
     # 默认O₂浓度水平（21%约等于210 mmol mol⁻¹）
     if o2_levels is None:
         o2_levels = [10, 21, 30, 40]  # 不同O₂百分比（转换为mmol mol⁻¹需×10）
     
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
-
     # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (7, 5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
+    apply_pub_style()
 
     # CO₂浓度数组
-    co2 = np.linspace(co2_range[0] + 1, co2_range[1], 300)
+    co2 = np.linspace(co2_range[0] + 1, co2_range[1], n_points)
     
-    fig, ax = plt.subplots()
-    
-    # 设置边框颜色为黑色
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
+    fig, ax = plt.subplots(figsize=(7, 5))
 
     # 黑白线型样式
     linestyles = ['-', '--', '-.', ':']
     markers = ['o', 's', '^', 'd']
     colors = ['black', '0.3', '0.5', '0.7']
     
-    # 绘制不同O₂浓度下的曲线
-    for i, o2_pct in enumerate(o2_levels):
-        o2 = o2_pct * 10  # 转换为 mmol mol⁻¹
-        rp = rubisco_rp(co2, o2, Rpmax, Ks, Kc, Ko)
-        
-        ls = linestyles[i % len(linestyles)]
-        color = colors[i % len(colors)]
+    # 一次广播计算全部曲线：行对应O₂水平（×10 转换为 mmol mol⁻¹），列对应CO₂
+    o2_col = np.asarray(o2_levels, dtype=np.float64)[:, None] * 10
+    rp_all = rubisco_rp(co2, o2_col, Rpmax, Ks, Kc, Ko)
+    
+    # 标记点位置对各曲线相同，一次取出全部曲线的标记点（两端各留出约 1/10 的范围；
+    # 末端按最后一个下标 len - 1 计算，n_points 很小时也不会越界）
+    sample_indices = np.linspace(len(co2)//10, len(co2) - 1 - len(co2)//10, 5, dtype=int)
+    co2_marks, rp_marks = co2[sample_indices], rp_all[:, sample_indices]
+    
+    # 各曲线的黑白样式（O₂水平多于样式数时循环使用）
+    n = len(o2_levels)
+    curve_ls = [linestyles[i % len(linestyles)] for i in range(n)]
+    curve_colors = [colors[i % len(colors)] for i in range(n)]
+    
+    # 绘制不同O₂浓度下的曲线：全部曲线合并为一个 LineCollection，图例使用代理句柄
+    segments = np.stack(np.broadcast_arrays(co2, rp_all), axis=-1)  # (曲线数, 点数, 2)
+    ax.add_collection(LineCollection(segments, colors=curve_colors, linestyles=curve_ls,
+                                     linewidths=2.5, zorder=2))
+    ax.autoscale_view()
+    curve_handles = [Line2D([], [], color=c, linestyle=ls, linewidth=2.5, label=f'O$_2$ = {o2_pct}%')
+                     for c, ls, o2_pct in zip(curve_colors, curve_ls, o2_levels)]
+    
+    for i in range(n):
+        color = curve_colors[i]
         marker = markers[i % len(markers)]
         
-        ax.plot(co2, rp, color=color, linestyle=ls, linewidth=2.5,
-                label=f'O$_2$ = {o2_pct}%')
-        
         # 添加一些标记点
-        sample_indices = np.linspace(30, len(co2)-30, 5, dtype=int)
-        ax.plot(co2[sample_indices], rp[sample_indices], marker=marker,
+        ax.plot(co2_marks, rp_marks[i], marker=marker,
                 color=color, markersize=6, linestyle='None',
                 markerfacecolor='white', markeredgewidth=1.5)
 
@@ -109,7 +165,7 @@ def make_plot(
     ax.set_ylim(0, None)
 
     # 图例与网格（黑白风格）
-    ax.legend(frameon=True, loc='best', edgecolor='black', fancybox=False)
+    ax.legend(handles=curve_handles, frameon=True, loc='best', edgecolor='black', fancybox=False)
     ax.grid(True, which='major', linestyle=':', color='0.5', alpha=0.7, linewidth=0.8)
 
     # 公式标注
@@ -123,8 +179,7 @@ def make_plot(
     ax.set_title('Rubisco呼吸速率对CO$_2$浓度的响应', fontsize=14, pad=12, weight='bold')
 
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'rubisco_rp.{ext}', bbox_inches='tight')
+    save_figure(fig, OUT_DIR / 'rubisco_rp', formats, pdf_backend=CAIRO_PDF_BACKEND)
 
     plt.close(fig)
 
@@ -134,72 +189,58 @@ def make_3d_plot(
     Ks: float = 2.5,
     Kc: float = 40.0,
     Ko: float = 25.0,
+    formats: tuple = PLOT_FORMATS,
 ):
     """
     创建3D曲面图展示Rp对CO₂和O₂的双重依赖
     """
-    from mpl_toolkits.mplot3d import Axes3D
-    
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
+    # 高质量出版参数（3D图字号略小，仅在本图内生效）
+    apply_pub_style()
 
-    # 高质量出版参数
-    plt.rcParams.update({
-        'font.size': 11,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (8, 6),
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
-
-    # 创建网格
-    co2 = np.linspace(1, 1000, 100)
-    o2_pct = np.linspace(5, 50, 100)
-    CO2, O2_PCT = np.meshgrid(co2, o2_pct)
+    # 创建网格：ogrid 返回 (50,1) 与 (1,50) 的稀疏网格，计算时广播成二维结果，
+    # 无需先分配完整的坐标矩阵。plot_surface 默认最多绘制 50×50 个网格点
+    # （rcount=ccount=50），更密的网格只会被抽稀，不会增加细节
+    O2_PCT, CO2 = np.ogrid[5:50:50j, 1:1000:50j]
     O2 = O2_PCT * 10  # 转换为 mmol mol⁻¹
     
     # 计算Rp
-    RP = rubisco_rp(CO2, O2, Rpmax, Ks, Kc, Ko)
+    RP = _rubisco_rp_grid(CO2.ravel(), O2.ravel(), Rpmax, Ks, Kc, Ko)
 
-    fig = plt.figure()
-    ax = fig.add_subplot(111, projection='3d')
-    
-    # 黑白风格的曲面图
-    surf = ax.plot_surface(CO2, O2_PCT, RP, cmap='gray', 
-                           edgecolor='black', linewidth=0.2, alpha=0.8,
-                           antialiased=True)
+    with plt.rc_context({'font.size': 11}):
+        fig = plt.figure(figsize=(8, 6))
+        ax = fig.add_subplot(111, projection='3d')
 
-    # 轴标签
-    ax.set_xlabel(r'CO$_2$ (μmol mol$^{-1}$)', fontsize=11, labelpad=10)
-    ax.set_ylabel(r'O$_2$ (%)', fontsize=11, labelpad=10)
-    ax.set_zlabel(r'$R_p$ (μmol CO$_2$ m$^{-2}$ s$^{-1}$)', fontsize=11, labelpad=10)
+        # 黑白风格的曲面图
+        # 注意：不设置 rasterized=True。50×50 网格的矢量面片在 PDF 中只有约 80 KB，
+        # 按 300 dpi 栅格化后的图像约为其 4 倍，保存也不会更快
+        surf = ax.plot_surface(CO2, O2_PCT, RP, cmap='gray', 
+                               edgecolor='black', linewidth=0.2, alpha=0.8,
+                               antialiased=True)
 
-    # 标题
-    ax.set_title('Rubisco呼吸速率的CO$_2$-O$_2$响应曲面', fontsize=13, pad=15, weight='bold')
+        # 轴标签
+        ax.set_xlabel(r'CO$_2$ (μmol mol$^{-1}$)', fontsize=11, labelpad=10)
+        ax.set_ylabel(r'O$_2$ (%)', fontsize=11, labelpad=10)
+        ax.set_zlabel(r'$R_p$ (μmol CO$_2$ m$^{-2}$ s$^{-1}$)', fontsize=11, labelpad=10)
 
-    # 添加颜色条
-    cbar = fig.colorbar(surf, ax=ax, shrink=0.5, aspect=5)
-    cbar.set_label(r'$R_p$', fontsize=11)
+        # 标题
+        ax.set_title('Rubisco呼吸速率的CO$_2$-O$_2$响应曲面', fontsize=13, pad=15, weight='bold')
 
-    # 调整视角
-    ax.view_init(elev=25, azim=45)
+        # 添加颜色条
+        cbar = fig.colorbar(surf, ax=ax, shrink=0.5, aspect=5)
+        cbar.set_label(r'$R_p$', fontsize=11)
 
-    # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'rubisco_rp_3d.{ext}', bbox_inches='tight', dpi=300)
+        # 调整视角
+        ax.view_init(elev=25, azim=45)
+
+        # 保存PNG和PDF格式
+        save_figure(fig, OUT_DIR / 'rubisco_rp_3d', formats, pdf_backend=CAIRO_PDF_BACKEND)
 
     plt.close(fig)
 
 
 if __name__ == '__main__':
-    # 生成2D图
-    make_plot()
-    print('2D图生成完成: figures/rubisco_rp.[png, pdf]')
-    
-    # 生成3D图
-    make_3d_plot()
-    print('3D图生成完成: figures/rubisco_rp_3d.[png, pdf]')
-
+    tasks = [
+        (make_plot, '2D图生成完成: ' + output_label('rubisco_rp')),
+        (make_3d_plot, '3D图生成完成: ' + output_label('rubisco_rp_3d')),
+    ]
+    run_tasks(tasks)
@@ -8,16 +8,78 @@
 - Q10: 温度系数，作物呼吸时一般取Q10 = 2
 - T0: 基准温度（通常25°C）
 
-输出：figures/temperature_respiration_*.{png, pdf}
+输出：figures/temperature_respiration_*.{png, pdf}（可用环境变量 PLOT_FORMATS 选择，如 PLOT_FORMATS=png）
 """
 
 from pathlib import Path
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # 只输出文件，不需要交互式后端
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
-# 设置中文字体（macOS 优先使用 PingFang SC）
-plt.rcParams['font.sans-serif'] = ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+from pub_style import (CAIRO_PDF_BACKEND, PLOT_FORMATS, apply_pub_style, output_label, run_tasks,
+                       save_figure)
+
+try:
+    from numba import vectorize, float64
+except ImportError:  # numba 为可选依赖，未安装时使用纯 NumPy 实现
+    vectorize = None
+
+# 输出目录
+OUT_DIR = Path('figures')
+
+# 不同的Q10值及其黑白线型样式：(线型, 颜色, 标记, 线宽)，典型值 Q10 = 2.0 加粗
+Q10_VALUES = [1.5, 2.0, 2.5, 3.0]
+Q10_STYLES = (
+    ('-', 'black', 'o', 2.5),
+    ('--', '0.3', 's', 3),
+    ('-.', '0.5', '^', 2.5),
+    (':', '0.7', 'd', 2.5),
+)
+
+# Q10敏感性图中的特定温度及其样式
+TEMPERATURES = [10, 20, 25, 30, 35]
+TEMPERATURE_STYLES = (
+    (':', '0.7', 'd', 2),
+    ('-.', '0.5', '^', 2),
+    ('--', '0.3', 's', 2),
+    ('-', 'black', 'o', 2.5),
+    ('-', '0.2', 'p', 3),
+)
+
+
+def _add_curves(ax, x, Y, colors, linestyles, linewidths, labels, zorder=2, highlight_idx=None):
+    """
+    将曲线（Y 的每一行）合并为一个 LineCollection 绘制，返回图例用的代理句柄
+    
+    集合内各曲线共用一个 zorder，因此 highlight_idx 指定的曲线单独绘制为 Line2D，
+    zorder 高出 5，保证始终压在与之相交的其他曲线之上
+    """
+    rest = [i for i in range(len(Y)) if i != highlight_idx]
+    segments = np.stack(np.broadcast_arrays(x, Y[rest]), axis=-1)  # (曲线数, 点数, 2)
+    ax.add_collection(LineCollection(segments, colors=[colors[i] for i in rest],
+                                     linestyles=[linestyles[i] for i in rest],
+                                     linewidths=[linewidths[i] for i in rest], zorder=zorder))
+    ax.autoscale_view()
+    if highlight_idx is not None:
+        i = highlight_idx
+        ax.plot(x, Y[i], color=colors[i], linestyle=linestyles[i], linewidth=linewidths[i],
+                zorder=zorder + 5)
+    return [Line2D([], [], color=c, linestyle=ls, linewidth=lw, label=label)
+            for c, ls, lw, label in zip(colors, linestyles, linewidths, labels)]
+
+
+if vectorize is not None:
+    # 编译为 ufunc：逐元素一次完成全部运算，大数组时不产生中间临时数组
+    # （传入的是 ln Q10，对数在调用前只计算一次）
+    @vectorize([float64(float64, float64, float64, float64)],
+               nopython=True, cache=True)
+    def _temperature_respiration_ufunc(T, Rm0, lnQ10, T0):
+        return Rm0 * np.exp(lnQ10 * ((T - T0) * 0.1))
+else:
+    _temperature_respiration_ufunc = None
 
 
 def temperature_respiration(T, Rm0, Q10, T0=25):
@@ -33,299 +95,223 @@ def temperature_respiration(T, Rm0, Q10, T0=25):
     返回:
         Rm: 温度T下的维持呼吸速率 (g CH₂O m⁻² d⁻¹)
     """
-    return Rm0 * Q10**((T - T0) / 10)
+    # Q10^x = exp(ln Q10 · x)：ln Q10 只计算一次，逐元素只需一次 exp
+    lnQ10 = np.log(Q10)
+    if _temperature_respiration_ufunc is not None:
+        return _temperature_respiration_ufunc(T, Rm0, lnQ10, T0)
+    return Rm0 * np.exp(lnQ10 * ((T - T0) * 0.1))
 
 
-def make_temperature_response_plot():
+def _q10_labels():
     """
-    绘制不同Q10值下的温度响应曲线
+    各Q10曲线的图例标签（典型值单独注明）
     """
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
+    return [f'$Q_{{10}}$ = {Q10:.1f}' + (' (典型值)' if Q10 == 2.0 else '') for Q10 in Q10_VALUES]
 
-    # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (7.5, 5.5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
 
-    # 参数
-    Rm0 = 5.0  # 基准呼吸速率
-    T0 = 25    # 基准温度
-    Q10_values = [1.5, 2.0, 2.5, 3.0]  # 不同的Q10值
+def _make_curve_figure(x, Y, labels, *, styles, xlabel, ylabel, title, text_annotation, text_y,
+                       highlight_idx=None, n_marks=5, mark_inset=15, text_fontsize=10,
+                       grid_alpha=0.7):
+    """
+    创建画布并绘制曲线（Y 的每一行），返回 fig, ax 和图例代理句柄
     
-    # 温度范围
-    T = np.linspace(0, 40, 300)
-    
-    fig, ax = plt.subplots()
-    
-    # 设置边框
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
-    
-    # 黑白线型样式
-    linestyles = ['-', '--', '-.', ':']
-    colors = ['black', '0.3', '0.5', '0.7']
-    markers = ['o', 's', '^', 'd']
-    
-    # 绘制不同Q10的曲线
-    for i, Q10 in enumerate(Q10_values):
-        Rm = temperature_respiration(T, Rm0, Q10, T0)
-        
-        ls = linestyles[i % len(linestyles)]
-        color = colors[i % len(colors)]
-        marker = markers[i % len(markers)]
-        
-        label = f'$Q_{{10}}$ = {Q10:.1f}' + (' (典型值)' if Q10 == 2.0 else '')
-        lw = 3 if Q10 == 2.0 else 2.5
-        
-        ax.plot(T, Rm, color=color, linestyle=ls, linewidth=lw, label=label,
-               zorder=10 if Q10 == 2.0 else 5)
-        
-        # 添加标记点
-        sample_indices = np.linspace(20, len(T)-20, 5, dtype=int)
-        ax.plot(T[sample_indices], Rm[sample_indices], marker=marker,
-               color=color, markersize=6 if Q10 != 2.0 else 7,
+    styles 为每条曲线的 (线型, 颜色, 标记, 线宽)，标记为 None 时不画；highlight_idx 为加粗置顶的曲线下标；
+    标记点两端各留出 1/mark_inset 的范围；text_annotation 为右侧标注框的内容，text_y 为其顶端位置。
+    各图特有的参考线由调用方在返回的 ax 上添加
+    """
+    # 高质量出版参数
+    apply_pub_style()
+
+    fig, ax = plt.subplots(figsize=(7.5, 5.5))
+    
+    # 曲线合并为一个 LineCollection，典型值曲线单独置顶
+    linestyles, colors, markers, linewidths = zip(*styles)
+    curve_handles = _add_curves(ax, x, Y, colors, linestyles, linewidths, labels,
+                                zorder=5, highlight_idx=highlight_idx)
+    
+    # 添加标记点（两端各留出 1/mark_inset 的范围；标记点位置对各曲线相同，一次取出全部曲线的标记点）
+    # 末端按最后一个下标 len - 1 计算，n_points 很小时也不会越界
+    inset = len(x) // mark_inset
+    mark_idx = np.linspace(inset, len(x) - 1 - inset, n_marks, dtype=int)
+    x_marks, Y_marks = x[mark_idx], Y[:, mark_idx]
+    for i, (color, marker) in enumerate(zip(colors, markers)):
+        if marker is None:
+            continue
+        ax.plot(x_marks, Y_marks[i], marker=marker,
+               color=color, markersize=7 if i == highlight_idx else 6,
                linestyle='None', markerfacecolor='white', markeredgewidth=1.5,
-               zorder=11 if Q10 == 2.0 else 6)
-    
-    # 标注基准点
-    ax.plot(T0, Rm0, marker='*', color='black', markersize=15,
-           markerfacecolor='white', markeredgewidth=2, zorder=15,
-           label=f'基准点 ($T_0$ = {T0}°C)')
-    
-    # 添加基准线
-    ax.axhline(y=Rm0, color='0.7', linestyle='--', linewidth=1, zorder=0,
-              alpha=0.5)
-    ax.axvline(x=T0, color='0.7', linestyle='--', linewidth=1, zorder=0,
-              alpha=0.5)
+               zorder=11 if i == highlight_idx else 6)
     
     # 轴标签
-    ax.set_xlabel(r'$T$ - 温度 (°C)', fontsize=13)
-    ax.set_ylabel(r'$R_m(T)$ - 维持呼吸速率 (g CH$_2$O m$^{-2}$ d$^{-1}$)', fontsize=12)
+    ax.set_xlabel(xlabel, fontsize=13)
+    ax.set_ylabel(ylabel, fontsize=12)
     
     # 范围
-    ax.set_xlim(0, 40)
+    ax.set_xlim(x[0], x[-1])
     ax.set_ylim(0, None)
     
-    # 图例
-    ax.legend(frameon=True, loc='upper left', edgecolor='black', 
-              fancybox=False, fontsize=10)
-    
     # 网格
-    ax.grid(True, which='major', linestyle=':', color='0.5', alpha=0.7, linewidth=0.8)
+    ax.grid(True, which='major', linestyle=':', color='0.5', alpha=grid_alpha, linewidth=0.8)
     
-    # 公式标注
-    formula = r'$R_m(T) = R_{m0} \cdot Q_{10}^{(T-T_0)/10}$'
-    param_text = f'$R_{{m0}}$ = {Rm0:.1f} g CH$_2$O m$^{{-2}}$ d$^{{-1}}$\n$T_0$ = {T0}°C'
-    ax.text(0.98, 0.45, formula + '\n\n' + param_text, transform=ax.transAxes,
-            ha='right', va='top', fontsize=10,
+    # 公式与参数标注
+    ax.text(0.98, text_y, text_annotation, transform=ax.transAxes,
+            ha='right', va='top', fontsize=text_fontsize,
             bbox=dict(boxstyle='round,pad=0.5', facecolor='white', 
                      edgecolor='black', linewidth=1))
     
     # 标题
-    ax.set_title('维持呼吸速率的温度响应', fontsize=14, pad=12, weight='bold')
+    ax.set_title(title, fontsize=14, pad=12, weight='bold')
+    
+    return fig, ax, curve_handles
+
+
+def _save_curve_figure(fig, ax, curve_handles, *, out_basename, legend_ncol=1,
+                       formats=PLOT_FORMATS):
+    """
+    添加图例（曲线之后是调用方添加的带标签参考线/点）并保存、关闭图
+    """
+    # 图例
+    handles = curve_handles + ax.get_legend_handles_labels()[0]
+    ax.legend(handles=handles, frameon=True, loc='upper left', edgecolor='black', 
+              fancybox=False, fontsize=10, ncol=legend_ncol)
     
     plt.tight_layout()
     
     # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'temperature_respiration.{ext}', bbox_inches='tight')
+    save_figure(fig, OUT_DIR / out_basename, formats, pdf_backend=CAIRO_PDF_BACKEND)
     
     plt.close(fig)
 
 
-def make_q10_sensitivity_plot():
+def make_temperature_response_plot(n_points=150, formats=PLOT_FORMATS):
     """
-    绘制Q10值对不同温度下呼吸速率的影响
+    绘制不同Q10值下的温度响应曲线
+    
+    n_points: 每条曲线的采样点数（平滑单调曲线，150 点已与更密的采样无差别；
+              更少时相邻点间距超过约 1 像素，PDF 路径简化不再合并线段，文件反而变大）
+    formats: 输出格式（扩展名），默认由环境变量 PLOT_FORMATS 决定
     """
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
+    # 参数
+    Rm0 = 5.0  # 基准呼吸速率
+    T0 = 25    # 基准温度
+    
+    # 温度范围
+    T = np.linspace(0, 40, n_points)
+    
+    # 一次广播计算全部曲线：行对应Q10，列对应温度
+    Rm_all = temperature_respiration(T[None, :], Rm0, np.array(Q10_VALUES)[:, None], T0)
+    
+    # 公式与参数标注
+    formula = r'$R_m(T) = R_{m0} \cdot Q_{10}^{(T-T_0)/10}$'
+    param_text = f'$R_{{m0}}$ = {Rm0:.1f} g CH$_2$O m$^{{-2}}$ d$^{{-1}}$\n$T_0$ = {T0}°C'
+    
+    fig, ax, curve_handles = _make_curve_figure(
+        T, Rm_all, _q10_labels(),
+        styles=Q10_STYLES,
+        highlight_idx=Q10_VALUES.index(2.0),
+        xlabel=r'$T$ - 温度 (°C)',
+        ylabel=r'$R_m(T)$ - 维持呼吸速率 (g CH$_2$O m$^{-2}$ d$^{-1}$)',
+        title='维持呼吸速率的温度响应',
+        text_annotation=formula + '\n\n' + param_text,
+        text_y=0.45,
+    )
+    
+    # 标注基准点
+    ax.plot(T0, Rm0, marker='*', color='black', markersize=15,
+           markerfacecolor='white', markeredgewidth=2, zorder=15,
+           label=f'基准点 ($T_0$ = {T0}°C)')
+    
+    # 添加基准线
+    ax.axhline(y=Rm0, color='0.7', linestyle='--', linewidth=1, zorder=0,
+              alpha=0.5)
+    ax.axvline(x=T0, color='0.7', linestyle='--', linewidth=1, zorder=0,
+              alpha=0.5)
+    
+    _save_curve_figure(fig, ax, curve_handles, out_basename='temperature_respiration',
+                       formats=formats)
 
-    # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (7.5, 5.5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
 
+def make_q10_sensitivity_plot(n_points=150, formats=PLOT_FORMATS):
+    """
+    绘制Q10值对不同温度下呼吸速率的影响
+    
+    n_points: 每条曲线的采样点数
+    formats: 输出格式（扩展名），默认由环境变量 PLOT_FORMATS 决定
+    """
     # 参数
     Rm0 = 5.0
     T0 = 25
     
-    # 特定温度
-    temperatures = [10, 20, 25, 30, 35]
-    
     # Q10范围
-    Q10 = np.linspace(1.2, 3.5, 300)
-    
-    fig, ax = plt.subplots()
-    
-    # 设置边框
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
-    
-    # 黑白线型样式
-    linestyles = [':', '-.', '--', '-', '-']
-    colors = ['0.7', '0.5', '0.3', 'black', '0.2']
-    linewidths = [2, 2, 2, 2.5, 3]
-    markers = ['d', '^', 's', 'o', 'p']
-    
-    # 绘制不同温度的曲线
-    for i, T in enumerate(temperatures):
-        Rm = temperature_respiration(T, Rm0, Q10, T0)
-        
-        ls = linestyles[i]
-        color = colors[i]
-        marker = markers[i]
-        lw = linewidths[i]
-        
-        label = f'$T$ = {T}°C' + (' (基准)' if T == T0 else '')
-        
-        ax.plot(Q10, Rm, color=color, linestyle=ls, linewidth=lw, label=label)
-        
-        # 添加标记点
-        if T == T0:
-            # 基准温度是水平线，只标注一个点
-            ax.plot([2.0], [Rm0], marker=marker, color=color, markersize=8,
-                   linestyle='None', markerfacecolor='white', markeredgewidth=1.5)
-        else:
-            sample_indices = np.linspace(30, len(Q10)-30, 4, dtype=int)
-            ax.plot(Q10[sample_indices], Rm[sample_indices], marker=marker,
-                   color=color, markersize=6, linestyle='None',
-                   markerfacecolor='white', markeredgewidth=1.5)
+    Q10 = np.linspace(1.2, 3.5, n_points)
     
-    # 标注典型Q10值
-    ax.axvline(x=2.0, color='0.7', linestyle='--', linewidth=1.5, 
-              zorder=0, alpha=0.6, label='典型$Q_{10}$ = 2.0')
-    
-    # 轴标签
-    ax.set_xlabel(r'$Q_{10}$ - 温度系数', fontsize=13)
-    ax.set_ylabel(r'$R_m(T)$ - 维持呼吸速率 (g CH$_2$O m$^{-2}$ d$^{-1}$)', fontsize=12)
+    # 一次广播计算全部曲线：行对应温度，列对应Q10
+    Rm_all = temperature_respiration(np.array(TEMPERATURES)[:, None], Rm0, Q10[None, :], T0)
     
-    # 范围
-    ax.set_xlim(1.2, 3.5)
-    ax.set_ylim(0, None)
-    
-    # 图例
-    ax.legend(frameon=True, loc='upper left', edgecolor='black', 
-              fancybox=False, fontsize=10, ncol=2)
-    
-    # 网格
-    ax.grid(True, which='major', linestyle=':', color='0.5', alpha=0.7, linewidth=0.8)
+    # 基准温度下的曲线是水平线，不画沿线的标记点
+    styles = [(ls, color, None if T == T0 else marker, lw)
+              for T, (ls, color, marker, lw) in zip(TEMPERATURES, TEMPERATURE_STYLES)]
     
     # 参数标注
     param_text = f'$R_{{m0}}$ = {Rm0:.1f} g CH$_2$O m$^{{-2}}$ d$^{{-1}}$\n$T_0$ = {T0}°C'
-    ax.text(0.98, 0.35, param_text, transform=ax.transAxes,
-            ha='right', va='top', fontsize=10,
-            bbox=dict(boxstyle='round,pad=0.5', facecolor='white', 
-                     edgecolor='black', linewidth=1))
     
-    # 标题
-    ax.set_title('不同温度下呼吸速率对$Q_{10}$的敏感性', fontsize=14, pad=12, weight='bold')
-    
-    plt.tight_layout()
+    fig, ax, curve_handles = _make_curve_figure(
+        Q10, Rm_all, [f'$T$ = {T}°C' + (' (基准)' if T == T0 else '') for T in TEMPERATURES],
+        styles=styles,
+        n_marks=4,
+        mark_inset=10,
+        xlabel=r'$Q_{10}$ - 温度系数',
+        ylabel=r'$R_m(T)$ - 维持呼吸速率 (g CH$_2$O m$^{-2}$ d$^{-1}$)',
+        title='不同温度下呼吸速率对$Q_{10}$的敏感性',
+        text_annotation=param_text,
+        text_y=0.35,
+    )
+    
+    # 基准温度曲线只在典型Q10处标注一个点
+    _, color, marker, _ = TEMPERATURE_STYLES[TEMPERATURES.index(T0)]
+    ax.plot([2.0], [Rm0], marker=marker, color=color, markersize=8,
+           linestyle='None', markerfacecolor='white', markeredgewidth=1.5, zorder=6)
     
-    # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'temperature_respiration_q10.{ext}', bbox_inches='tight')
+    # 标注典型Q10值
+    ax.axvline(x=2.0, color='0.7', linestyle='--', linewidth=1.5, 
+              zorder=0, alpha=0.6, label='典型$Q_{10}$ = 2.0')
     
-    plt.close(fig)
+    _save_curve_figure(fig, ax, curve_handles, out_basename='temperature_respiration_q10',
+                       legend_ncol=2, formats=formats)
 
 
-def make_relative_change_plot():
+def make_relative_change_plot(n_points=150, formats=PLOT_FORMATS):
     """
     绘制相对于基准温度的呼吸速率变化倍数
+    
+    n_points: 每条曲线的采样点数
+    formats: 输出格式（扩展名），默认由环境变量 PLOT_FORMATS 决定
     """
-    # 创建输出目录
-    out_dir = Path('figures')
-    out_dir.mkdir(exist_ok=True)
-
-    # 高质量出版参数
-    try:
-        plt.style.use('seaborn-v0_8-whitegrid')
-    except Exception:
-        plt.style.use('seaborn-whitegrid')
-    
-    plt.rcParams.update({
-        'font.size': 12,
-        'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
-        'axes.unicode_minus': False,
-        'figure.figsize': (7.5, 5.5),
-        'axes.linewidth': 1.2,
-        'lines.linewidth': 2,
-        'savefig.dpi': 300,
-        'pdf.fonttype': 42,
-        'ps.fonttype': 42,
-    })
-
     # 参数
     T0 = 25
-    Q10_values = [1.5, 2.0, 2.5, 3.0]
     
     # 温度范围
-    T = np.linspace(0, 40, 300)
-    
-    fig, ax = plt.subplots()
-    
-    # 设置边框
-    for spine in ax.spines.values():
-        spine.set_edgecolor('black')
-        spine.set_linewidth(1.2)
-    
-    # 黑白线型样式
-    linestyles = ['-', '--', '-.', ':']
-    colors = ['black', '0.3', '0.5', '0.7']
-    markers = ['o', 's', '^', 'd']
-    
-    # 绘制相对变化曲线
-    for i, Q10 in enumerate(Q10_values):
-        # 相对变化 = Rm(T) / Rm0 = Q10^((T-T0)/10)
-        relative_change = Q10**((T - T0) / 10)
-        
-        ls = linestyles[i % len(linestyles)]
-        color = colors[i % len(colors)]
-        marker = markers[i % len(markers)]
-        
-        label = f'$Q_{{10}}$ = {Q10:.1f}' + (' (典型值)' if Q10 == 2.0 else '')
-        lw = 3 if Q10 == 2.0 else 2.5
-        
-        ax.plot(T, relative_change, color=color, linestyle=ls, linewidth=lw, 
-               label=label, zorder=10 if Q10 == 2.0 else 5)
-        
-        # 添加标记点
-        sample_indices = np.linspace(20, len(T)-20, 5, dtype=int)
-        ax.plot(T[sample_indices], relative_change[sample_indices], marker=marker,
-               color=color, markersize=6 if Q10 != 2.0 else 7,
-               linestyle='None', markerfacecolor='white', markeredgewidth=1.5,
-               zorder=11 if Q10 == 2.0 else 6)
+    T = np.linspace(0, 40, n_points)
+    
+    # 相对变化 = Rm(T) / Rm0 = Q10^((T-T0)/10)，一次广播计算全部曲线
+    relative_all = temperature_respiration(T[None, :], 1.0, np.array(Q10_VALUES)[:, None], T0)
+    
+    # 公式标注
+    formula = r'$\frac{R_m(T)}{R_{m0}} = Q_{10}^{(T-T_0)/10}$'
+    param_text = f'$T_0$ = {T0}°C'
+    
+    fig, ax, curve_handles = _make_curve_figure(
+        T, relative_all, _q10_labels(),
+        styles=Q10_STYLES,
+        highlight_idx=Q10_VALUES.index(2.0),
+        xlabel=r'$T$ - 温度 (°C)',
+        ylabel=r'$R_m(T) / R_{m0}$ - 相对呼吸速率',
+        title='相对于基准温度的呼吸速率变化',
+        text_annotation=formula + '\n' + param_text,
+        text_y=0.95,
+        text_fontsize=11,
+        grid_alpha=0.5,
+    )
     
     # 添加基准线 (倍数=1)
     ax.axhline(y=1, color='0.5', linestyle='-', linewidth=1.5, zorder=0,
@@ -338,51 +324,17 @@ def make_relative_change_plot():
         ax.axhline(y=mult, color='0.8', linestyle=':', linewidth=0.8, 
                   zorder=0, alpha=0.5)
     
-    # 轴标签
-    ax.set_xlabel(r'$T$ - 温度 (°C)', fontsize=13)
-    ax.set_ylabel(r'$R_m(T) / R_{m0}$ - 相对呼吸速率', fontsize=12)
-    
-    # 范围
-    ax.set_xlim(0, 40)
-    ax.set_ylim(0, None)
-    
-    # 图例
-    ax.legend(frameon=True, loc='upper left', edgecolor='black', 
-              fancybox=False, fontsize=10)
-    
-    # 网格
-    ax.grid(True, which='major', linestyle=':', color='0.5', alpha=0.5, linewidth=0.8)
-    
-    # 公式标注
-    formula = r'$\frac{R_m(T)}{R_{m0}} = Q_{10}^{(T-T_0)/10}$'
-    param_text = f'$T_0$ = {T0}°C'
-    ax.text(0.98, 0.95, formula + '\n' + param_text, transform=ax.transAxes,
-            ha='right', va='top', fontsize=11,
-            bbox=dict(boxstyle='round,pad=0.5', facecolor='white', 
-                     edgecolor='black', linewidth=1))
-    
-    # 标题
-    ax.set_title('相对于基准温度的呼吸速率变化', fontsize=14, pad=12, weight='bold')
-    
-    plt.tight_layout()
-    
-    # 保存PNG和PDF格式
-    for ext in ['png', 'pdf']:
-        fig.savefig(out_dir / f'temperature_respiration_relative.{ext}', bbox_inches='tight')
-    
-    plt.close(fig)
+    _save_curve_figure(fig, ax, curve_handles, out_basename='temperature_respiration_relative',
+                       formats=formats)
 
 
 if __name__ == '__main__':
-    # 生成温度响应曲线
-    make_temperature_response_plot()
-    print('温度响应图生成完成: figures/temperature_respiration.[png, pdf]')
-    
-    # 生成Q10敏感性分析
-    make_q10_sensitivity_plot()
-    print('Q10敏感性图生成完成: figures/temperature_respiration_q10.[png, pdf]')
-    
-    # 生成相对变化图
-    make_relative_change_plot()
-    print('相对变化图生成完成: figures/temperature_respiration_relative.[png, pdf]')
-
+    tasks = [
+        (make_temperature_response_plot,
+         '温度响应图生成完成: ' + output_label('temperature_respiration')),
+        (make_q10_sensitivity_plot,
+         'Q10敏感性图生成完成: ' + output_label('temperature_respiration_q10')),
+        (make_relative_change_plot,
+         '相对变化图生成完成: ' + output_label('temperature_respiration_relative')),
+    ]
+    run_tasks(tasks)
@@ -0,0 +1,160 @@
+"""
+各绘图脚本共用的出版级绘图样式与图片保存
+黑白 whitegrid 风格 + 中文字体 + 300 dpi 输出：各脚本的绘图函数在绘图前调用 apply_pub_style()，
+绘图完成后用 save_figure() 保存；各脚本的 __main__ 用 run_tasks() 并行生成全部图
+
+输出格式默认为PNG和PDF，可用环境变量 PLOT_FORMATS 选择（如 PLOT_FORMATS=png）
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+try:
+    import mplcairo.base  # noqa: F401  可选依赖：用 Cairo 渲染PDF，文件更小、保存更快
+    # 只有 Rubisco 与温度两个模块通过 save_figure(pdf_backend=CAIRO_PDF_BACKEND) 使用，
+    # 其余模块的PDF始终由 matplotlib 自带的后端输出
+    CAIRO_PDF_BACKEND = 'module://mplcairo.base'
+except ImportError:  # 未安装 mplcairo 时使用 matplotlib 自带的PDF后端
+    CAIRO_PDF_BACKEND = None
+
+# seaborn-v0_8-whitegrid 样式的参数（直接写入，免去样式表查找与解析）
+_WHITEGRID = {
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.facecolor': 'white',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'axes.linewidth': 1.0,
+    'figure.facecolor': 'white',
+    'font.family': ['sans-serif'],
+    'font.sans-serif': ['Arial', 'Liberation Sans', 'DejaVu Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'grid.color': '.8',
+    'grid.linestyle': '-',
+    'image.cmap': 'Greys',
+    'legend.frameon': False,
+    'legend.numpoints': 1,
+    'legend.scatterpoints': 1,
+    'lines.solid_capstyle': 'round',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'xtick.direction': 'out',
+    'xtick.major.size': 0.0,
+    'xtick.minor.size': 0.0,
+    'ytick.color': '.15',
+    'ytick.direction': 'out',
+    'ytick.major.size': 0.0,
+    'ytick.minor.size': 0.0,
+}
+
+# 出版级绘图参数（各图共用，尺寸在创建画布时单独指定）
+PUB_RCPARAMS = {
+    'font.size': 12,
+    # 中文字体（macOS 优先使用 PingFang SC）只在此处设置
+    'font.sans-serif': ['PingFang SC', 'STSong', 'SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
+    'axes.unicode_minus': False,
+    'axes.edgecolor': 'black',
+    'axes.linewidth': 1.2,
+    'lines.linewidth': 2,
+    # 线条路径简化：合并密集采样中近乎共线的线段
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'savefig.dpi': 300,
+    # 嵌入 TrueType 字体（只写入用到的字形子集，大型 CJK 字体也不会整体嵌入）；
+    # 不要改用 Type 3：其单个字体最多 256 个字形，含中文与 μ 的标签保存时会报错
+    'pdf.fonttype': 42,
+    'ps.fonttype': 42,
+}
+
+
+def apply_pub_style(extra_rcparams=None):
+    """
+    应用出版级绘图样式，extra_rcparams 为各脚本额外的参数（如布局、默认尺寸）
+
+    注意：每次调用都会重新写入 rcParams（只是字典更新，不查找样式表，开销可以忽略），
+    不设每进程只执行一次的标记：make_all_figures 在每个任务结束后恢复 rcParams，
+    同一子进程中后续模块的图仍需重新应用样式。
+    """
+    plt.rcParams.update(_WHITEGRID)
+    plt.rcParams.update(PUB_RCPARAMS)
+    if extra_rcparams:
+        plt.rcParams.update(extra_rcparams)
+
+
+# 直线的首尾端点不画标记，只在中间的采样点上画（与 line_with_marks 配合使用）
+MARK_EVERY = slice(1, -1)
+
+
+def line_with_marks(x_min, x_max, n_marks=5):
+    """
+    直线的横坐标：两个端点之间插入 10%–90% 范围内均匀分布的标记点位置
+    """
+    span = x_max - x_min
+    marks = np.linspace(x_min + 0.1 * span, x_min + 0.9 * span, n_marks)
+    return np.concatenate(([x_min], marks, [x_max]))
+
+
+# 输出格式；开发调试时可设置 PLOT_FORMATS=png 跳过较慢的PDF输出
+PLOT_FORMATS = tuple(ext.strip() for ext in os.environ.get('PLOT_FORMATS', 'png,pdf').split(',')
+                     if ext.strip())
+
+# 各格式的额外保存参数
+SAVEFIG_KWARGS = {
+    # 设置 FAST_PNG=1 时以最低压缩级别写 PNG（编码更快，文件略大）
+    'png': {'pil_kwargs': {'compress_level': 1}} if os.environ.get('FAST_PNG') == '1' else {},
+}
+
+
+def save_figure(fig, path_stem, formats=PLOT_FORMATS, pdf_backend=None):
+    """
+    依次保存各输出格式（默认PNG和PDF），path_stem 为不含扩展名的输出路径
+
+    pdf_backend 不为 None 时只在保存PDF时切换到该渲染后端（如 CAIRO_PDF_BACKEND）；
+    进程的全局后端始终为 Agg（make_all_figures 在同一进程中导入全部绘图模块，
+    导入时切换后端会影响其他模块）
+
+    注意：各格式须串行保存。savefig(bbox_inches='tight') 会临时修改
+    图的 dpi、尺寸和 bbox，再恢复原值，多线程同时保存同一张图会相互干扰。
+    也不先调用 fig.canvas.draw() 再复用算好的边界：bbox_inches='tight' 求边界时
+    只做不输出像素的布局（draw_without_rendering），开销远小于一次完整的 Agg 绘制；
+    预先绘制反而更慢，且边界按屏幕 dpi 计算，PNG 尺寸会偏差几个像素。
+
+    输出目录不存在时自动创建，各 make_* 函数作为库函数直接调用时也能保存。
+    """
+    path_stem = Path(path_stem)
+    path_stem.parent.mkdir(parents=True, exist_ok=True)
+    for ext in formats:
+        kwargs = SAVEFIG_KWARGS.get(ext, {})
+        if ext == 'pdf' and pdf_backend is not None:
+            kwargs = {**kwargs, 'backend': pdf_backend}
+        fig.savefig(path_stem.with_suffix(f'.{ext}'), bbox_inches='tight', **kwargs)
+
+
+def output_label(name, formats=PLOT_FORMATS):
+    """
+    完成提示中的输出文件描述，按实际保存的格式生成，如 figures/rubisco_rp.[png, pdf]
+    """
+    return f'figures/{name}.[{", ".join(formats)}]'
+
+
+def _run_task(task):
+    """
+    在子进程中生成一张图，返回完成提示
+    """
+    plot_func, message = task
+    plot_func()
+    return message
+
+
+def run_tasks(tasks):
+    """
+    并行生成各图并按顺序打印完成提示，tasks 的每项为 (绘图函数, 完成提示)
+
+    各图相互独立，每张图一个子进程；用进程而不是线程：pyplot 的全局状态不是线程安全的
+    """
+    with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+        for message in executor.map(_run_task, tasks):
+            print(message)